@@ -122,6 +122,27 @@ def test_simulation_load_export_hdf5_gz_explicit(split_string, tmp_path):
     assert SIM == SIM2, "original and loaded simulations are not the same"
 
 
+def test_simulation_load_export_hdf5_gz_fileobj(split_string, tmp_path):
+    path = str(tmp_path / "simulation.hdf5.gz")
+    with open(path, "wb") as file_obj:
+        SIM.to_hdf5_gz(file_obj)
+    SIM2 = td.Simulation.from_hdf5_gz(path)
+    assert SIM == SIM2, "original and loaded simulations are not the same"
+    with open(path, "rb") as file_obj:
+        SIM3 = td.Simulation.from_hdf5_gz(file_obj)
+    assert SIM == SIM3, "original and loaded simulations are not the same"
+
+
+def test_simulation_export_hdf5_gz_fileobj_spooled(monkeypatch, tmp_path):
+    # the temporary buffer spills to disk
+    monkeypatch.setattr("tidy3d.components.base.SPOOL_MAX_SIZE", 1)
+    path = str(tmp_path / "simulation.hdf5.gz")
+    with open(path, "wb") as file_obj:
+        SIM.to_hdf5_gz(file_obj)
+    SIM2 = td.Simulation.from_hdf5_gz(path)
+    assert SIM == SIM2, "original and loaded simulations are not the same"
+
+
 def test_simulation_load_export_pckl(tmp_path):
     path = str(tmp_path / "simulation.pckl")
     with open(path, "wb") as pickle_file:
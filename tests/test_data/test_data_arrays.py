@@ -3,8 +3,15 @@ import pytest
 import numpy as np
 from typing import Tuple, List
 
+import h5py
+
 import tidy3d as td
 from tidy3d.exceptions import DataError
+from tidy3d.components.data.data_array import (
+    DATA_ARRAY_VALUE_NAME,
+    HDF5_CHUNK_NBYTES,
+    _hdf5_chunk_shape,
+)
 
 np.random.seed(4)
 
@@ -328,3 +335,23 @@ def test_spatial_data_array():
 
     with pytest.raises(DataError):
         reflected = arr.reflect(axis=2, center=2.5)
+
+
+def test_to_hdf5_compression(tmp_path):
+    path = str(tmp_path / "data.hdf5")
+    data = make_scalar_field_data_array("Ex")
+    data.to_hdf5(path, group_path="/data", compression={"compression": "gzip", "shuffle": True})
+    with h5py.File(path, "r") as f_handle:
+        dataset = f_handle["/data"][DATA_ARRAY_VALUE_NAME]
+        assert dataset.compression == "gzip"
+        assert dataset.chunks is not None
+    data2 = td.ScalarFieldDataArray.from_hdf5(path, group_path="/data")
+    assert np.all(data == data2)
+
+
+def test_hdf5_chunk_shape():
+    itemsize = 8
+    chunks = _hdf5_chunk_shape((10, 20, 256, 256), itemsize)
+    assert chunks == (1, 2, 256, 256)
+    assert itemsize * np.prod(chunks) <= HDF5_CHUNK_NBYTES
+    assert _hdf5_chunk_shape((3, 4), itemsize) == (3, 4)
@@ -1,3 +1,6 @@
+import sys
+from concurrent.futures import Future
+
 import pytest
 import responses
 import numpy as np
@@ -11,10 +14,13 @@ from tidy3d.plugins.mode import ModeSolver
 from tidy3d.plugins.mode.mode_solver import MODE_MONITOR_NAME
 from tidy3d.plugins.mode.derivatives import create_sfactor_b, create_sfactor_f
 from tidy3d.plugins.mode.solver import compute_modes
-from tidy3d.exceptions import SetupError
+from tidy3d.exceptions import SetupError, Tidy3dImportError
 from ..utils import assert_log_level, log_capture  # noqa: F401
 from tidy3d import ScalarFieldDataArray
 from tidy3d.web.core.environment import Env
+from tidy3d.web.api.mode import ModeSolverTask, _wait, _status_logger
+from tidy3d.web.api.mode import POLL_INTERVAL_MIN, POLL_INTERVAL_MAX, POLL_INTERVAL_FACTOR
+from tidy3d.web.api.mode import POLL_PREFETCH_TIME
 
 
 WG_MEDIUM = td.Medium(permittivity=4.0, conductivity=1e-4)
@@ -38,7 +44,7 @@ def mock_remote_api(monkeypatch):
     def void(*args, **kwargs):
         return None
 
-    def mock_download(resource_id, remote_filename, to_file, *args, **kwargs):
+    def make_mode_solver_data():
         simulation = td.Simulation(
             size=SIM_SIZE,
             grid_spec=td.GridSpec(wavelength=1.0),
@@ -61,15 +67,25 @@ def mock_remote_api(monkeypatch):
             mode_spec=mode_spec,
             freqs=[td.C_0 / 1.0],
         )
-        ms.data_raw.to_file(to_file)
+        return ms.data_raw
+
+    def mock_download(resource_id, remote_filename, to_file, *args, **kwargs):
+        make_mode_solver_data().to_file(to_file)
+
+    def mock_download_fileobj(resource_id, remote_filename, fileobj, *args, **kwargs):
+        make_mode_solver_data().to_hdf5(fileobj)
+        fileobj.seek(0)
+        return fileobj
 
     from tidy3d.web.core import http_util as httputil
 
     monkeypatch.setattr(httputil, "api_key", lambda: "api_key")
     monkeypatch.setattr(httputil, "get_version", lambda: td.version.__version__)
-    monkeypatch.setattr("tidy3d.web.api.mode.upload_file", void)
+    monkeypatch.setattr("tidy3d.web.api.mode.upload_fileobj", void)
     monkeypatch.setattr("tidy3d.web.api.mode.download_gz_file", mock_download)
     monkeypatch.setattr("tidy3d.web.api.mode.download_file", mock_download)
+    monkeypatch.setattr("tidy3d.web.api.mode.download_gz_fileobj", mock_download_fileobj)
+    monkeypatch.setattr("tidy3d.web.api.mode.download_fileobj", mock_download_fileobj)
 
     responses.add(
         responses.GET,
@@ -345,6 +361,327 @@ def test_mode_solver_simple(mock_remote_api, local):
     assert len(nS_add_mode_solver_monitor.monitors) == len(simulation.monitors) + 1
 
 
+@responses.activate
+def test_mode_solver_web_results_in_memory(mock_remote_api, tmp_path, monkeypatch):
+    """Mode solver results are loaded without writing a file when ``results_file=None``."""
+    monkeypatch.chdir(tmp_path)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=3),
+        freqs=[td.C_0 / 1.0],
+    )
+    data = msweb.run(ms, results_file=None)
+    assert data is not None
+    assert not any(tmp_path.iterdir())
+
+
+@responses.activate
+def test_mode_solver_web_run_batch(mock_remote_api, tmp_path, monkeypatch):
+    """Several mode solvers are submitted and polled together."""
+    monkeypatch.chdir(tmp_path)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    mode_solvers = [
+        ModeSolver(
+            simulation=simulation,
+            plane=PLANE,
+            mode_spec=td.ModeSpec(num_modes=3),
+            freqs=[td.C_0 / 1.0],
+            direction=direction,
+        )
+        for direction in ("+", "-")
+    ]
+    results = msweb.run_batch(mode_solvers, task_names=[TASK_NAME] * len(mode_solvers))
+    assert len(results) == len(mode_solvers)
+    assert all(data is not None for data in results)
+
+    with pytest.raises(ValueError):
+        msweb.run_batch(mode_solvers, task_names=[TASK_NAME])
+
+
+@responses.activate
+def test_mode_solver_web_run_batch_error(
+    mock_remote_api, tmp_path, monkeypatch, log_capture  # noqa: F811
+):
+    """Results of the successful mode solvers are kept when others end in error."""
+    monkeypatch.chdir(tmp_path)
+
+    def get_info(self):
+        status = "error" if self.mode_solver.direction == "-" else "success"
+        return self.copy(update={"status": status})
+
+    monkeypatch.setattr(ModeSolverTask, "get_info", get_info)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    mode_solvers = [
+        ModeSolver(
+            simulation=simulation,
+            plane=PLANE,
+            mode_spec=td.ModeSpec(num_modes=3),
+            freqs=[td.C_0 / 1.0],
+            direction=direction,
+        )
+        for direction in ("+", "-")
+    ]
+    results = msweb.run_batch(mode_solvers, task_names=[TASK_NAME] * len(mode_solvers))
+    assert results[0] is not None
+    assert results[1] is None
+    assert_log_level(log_capture, "ERROR", contains_str=TASK_ID)
+
+    with pytest.raises(td.exceptions.WebError, match=TASK_ID):
+        msweb.run(mode_solvers[1], results_file=None)
+
+
+def test_mode_solver_web_status_logger(monkeypatch, log_capture):  # noqa: F811
+    """Status messages always reach the log handlers and are printed to the console if verbose,
+    unless the console log handler already shows them."""
+    printed = []
+
+    class FakeConsole:
+        def log(self, message):
+            printed.append(message)
+
+    class FakeHandler:
+        def __init__(self, level):
+            self.level = level
+
+        def handle(self, level, level_name, message):
+            pass
+
+    monkeypatch.setattr("tidy3d.web.api.mode.get_logging_console", lambda: FakeConsole())
+
+    monkeypatch.setitem(td.log.handlers, "console", FakeHandler(level=20))
+    _status_logger(verbose=False)("quiet")
+    _status_logger(verbose=True)("printed")
+    monkeypatch.setitem(td.log.handlers, "console", FakeHandler(level=10))
+    _status_logger(verbose=True)("handled")
+
+    assert log_capture == [(20, "quiet"), (10, "printed"), (10, "handled")]
+    assert printed == ["printed"]
+
+
+def test_mode_solver_web_wait(monkeypatch):
+    """The polling interval grows while the status is unchanged, up to a cap, and is reset on
+    status changes. The status requests are sent before the end of each interval."""
+    events = []
+    poll_statuses = iter(["queued"] * 12 + ["running", "success"])
+
+    class FakeTask:
+        status = "queued"
+
+        def get_info(self):
+            events.append("get_info")
+            return FakeTask.Info(next(poll_statuses))
+
+        class Info:
+            def __init__(self, status):
+                self.status = status
+
+    class SyncExecutor:
+        """Runs the submitted calls right away, to record them in order with the sleeps."""
+
+        def __init__(self, max_workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    monkeypatch.setattr("tidy3d.web.api.mode.ThreadPoolExecutor", SyncExecutor)
+    monkeypatch.setattr("tidy3d.web.api.mode.time.sleep", lambda delay: events.append(delay))
+    logged = []
+    statuses = _wait([FakeTask()], ["Mode solver"], logged.append)
+
+    assert statuses == ["success"]
+    assert logged == [
+        f"Mode solver status: {status}" for status in ("queued", "running", "success")
+    ]
+
+    delays = [
+        min(POLL_INTERVAL_MIN * POLL_INTERVAL_FACTOR**k, POLL_INTERVAL_MAX) for k in range(13)
+    ]
+    delays += [POLL_INTERVAL_MIN]  # reset after the change to "running"
+    assert delays[-2] == POLL_INTERVAL_MAX
+    expected = []
+    for delay in delays:
+        expected += [
+            max(delay - POLL_PREFETCH_TIME, 0),
+            "get_info",
+            min(delay, POLL_PREFETCH_TIME),
+        ]
+    assert events == pytest.approx(expected)
+
+
+@responses.activate
+def test_mode_solver_web_validates_simulation_once(mock_remote_api, monkeypatch):
+    """A simulation shared by several mode solvers is validated once per instance."""
+    validated = []
+
+    def validate_pre_upload(self, source_required: bool = True):
+        validated.append(self)
+
+    monkeypatch.setattr(td.Simulation, "validate_pre_upload", validate_pre_upload)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    mode_solvers = [
+        ModeSolver(
+            simulation=simulation,
+            plane=PLANE,
+            mode_spec=td.ModeSpec(num_modes=3),
+            freqs=[td.C_0 / 1.0],
+            direction=direction,
+        )
+        for direction in ("+", "-")
+    ]
+    for mode_solver in mode_solvers:
+        ModeSolverTask.create(mode_solver)
+    assert validated == [simulation]
+
+    # new simulation instances are validated again
+    updated = mode_solvers[0].updated_copy(simulation=simulation.updated_copy(run_time=2e-12))
+    reduced = mode_solvers[0].reduced_simulation_copy
+    for mode_solver in (updated, reduced):
+        ModeSolverTask.create(mode_solver)
+    assert len(validated) == 3
+    assert validated[1] is updated.simulation
+    assert validated[2] is reduced.simulation
+
+
+@pytest.mark.parametrize("file_type", ["Gz", "Json"])
+@responses.activate
+def test_mode_solver_web_get_modesolver(mock_remote_api, file_type, tmp_path, monkeypatch):
+    """The mode solver downloaded from a task is stored in the requested file, if any."""
+    monkeypatch.chdir(tmp_path)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=3),
+        freqs=[td.C_0 / 1.0],
+    )
+
+    def mock_download_gz_fileobj(resource_id, remote_filename, fileobj, *args, **kwargs):
+        ms.to_hdf5(fileobj)
+        fileobj.seek(0)
+        return fileobj
+
+    def mock_download_fileobj(resource_id, remote_filename, fileobj, *args, **kwargs):
+        fileobj.write(ms._json_string.encode())
+        fileobj.seek(0)
+        return fileobj
+
+    def mock_download_file(resource_id, remote_filename, to_file, *args, **kwargs):
+        simulation.to_file(to_file)
+
+    monkeypatch.setattr("tidy3d.web.api.mode.download_gz_fileobj", mock_download_gz_fileobj)
+    monkeypatch.setattr("tidy3d.web.api.mode.download_fileobj", mock_download_fileobj)
+    monkeypatch.setattr("tidy3d.web.api.mode.download_file", mock_download_file)
+
+    task = ModeSolverTask(refId=TASK_ID, id=SOLVER_ID, fileType=file_type)
+    sim_file = str(tmp_path / "simulation.json")
+    for to_file in ("mode_solver.hdf5", "mode_solver.json"):
+        path = str(tmp_path / to_file)
+        assert task.get_modesolver(to_file=path, sim_file=sim_file) == ms
+        assert ModeSolver.from_file(path) == ms
+
+    assert task.get_modesolver(to_file=None, sim_file=sim_file) == ms
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        ["mode_solver.hdf5", "mode_solver.json"]
+        + (["simulation.json"] if file_type == "Json" else [])
+    )
+
+    # the task info comes from the server, with "Json" file type
+    path = str(tmp_path / "mode_solver_task.hdf5")
+    task = ModeSolverTask.get(TASK_ID, SOLVER_ID, to_file=path, sim_file=sim_file)
+    assert task.mode_solver == ms
+    assert ModeSolver.from_file(path) == ms
+
+
+def test_mode_solver_web_hdf5plugin_missing(mock_remote_api, monkeypatch):
+    """Plain hdf5 mode solver files are read without 'hdf5plugin', which is only required when
+    mode solvers are transferred with zstd compression."""
+    monkeypatch.setitem(sys.modules, "hdf5plugin", None)
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=3),
+        freqs=[td.C_0 / 1.0],
+    )
+    downloads = []
+
+    def mock_download_fileobj(resource_id, remote_filename, fileobj, *args, **kwargs):
+        downloads.append(remote_filename)
+        ms.to_hdf5(fileobj)
+        fileobj.seek(0)
+        return fileobj
+
+    monkeypatch.setattr("tidy3d.web.api.mode.download_fileobj", mock_download_fileobj)
+    task = ModeSolverTask(refId=TASK_ID, id=SOLVER_ID, fileType="Hdf5")
+    assert task.get_modesolver(to_file=None) == ms
+    assert len(downloads) == 1
+
+    # reading a natively compressed file without the filter reports the missing package
+    def mock_from_hdf5(*args, **kwargs):
+        raise OSError(
+            "Can't synchronously read data (required filter 'Zstandard' is not registered)"
+        )
+
+    with monkeypatch.context() as m:
+        m.setattr(ModeSolver, "from_hdf5", mock_from_hdf5)
+        with pytest.raises(Tidy3dImportError):
+            task.get_modesolver(to_file=None)
+    assert len(downloads) == 2
+
+    # the missing package is reported before downloading
+    monkeypatch.setattr("tidy3d.web.api.mode.MODESOLVER_HDF5_ZSTD", True)
+    with pytest.raises(Tidy3dImportError):
+        task.get_modesolver(to_file=None)
+    assert len(downloads) == 2
+
+
 @pytest.mark.parametrize("local", [True, False])
 @responses.activate
 def test_mode_solver_custom_medium(mock_remote_api, local, tmp_path):
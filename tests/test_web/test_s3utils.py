@@ -0,0 +1,88 @@
+import gzip
+import io
+
+import numpy as np
+import pytest
+
+from tidy3d.web.core.exceptions import WebError
+from tidy3d.web.core.s3utils import _GunzipWriter, download_file
+
+DATA = np.random.default_rng(0).integers(0, 16, size=200_000, dtype=np.uint8).tobytes()
+
+
+def gunzip(compressed: bytes, chunk_size: int) -> bytes:
+    extracted = io.BytesIO()
+    writer = _GunzipWriter(extracted)
+    for start in range(0, len(compressed), chunk_size):
+        writer.write(compressed[start : start + chunk_size])
+    writer.close()
+    return extracted.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 10**7])
+def test_gunzip_writer(chunk_size):
+    compressed = gzip.compress(DATA)
+    assert gunzip(compressed, chunk_size) == DATA
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 10**7])
+def test_gunzip_writer_multi_member(chunk_size):
+    members = [DATA[:1000], DATA[1000:], b"", DATA[:10]]
+    compressed = b"".join(gzip.compress(member) for member in members)
+    assert gunzip(compressed, chunk_size) == b"".join(members)
+
+
+def test_gunzip_writer_empty():
+    assert gunzip(b"", 1) == b""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 10**7])
+def test_gunzip_writer_truncated(chunk_size):
+    compressed = gzip.compress(DATA)
+    with pytest.raises(WebError):
+        gunzip(compressed[:-100], chunk_size)
+
+    # truncated in the second member
+    compressed = gzip.compress(DATA[:1000]) + compressed
+    with pytest.raises(WebError):
+        gunzip(compressed[:-1], chunk_size)
+
+
+class FakeToken:
+    def get_bucket(self):
+        return "bucket"
+
+    def get_s3_key(self):
+        return "key"
+
+    def get_client(self):
+        return FakeClient()
+
+
+class FakeClient:
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(DATA)}
+
+    def download_fileobj(self, Bucket, Key, Fileobj, Callback):
+        for start in range(0, len(DATA), 1000):
+            Fileobj.write(DATA[start : start + 1000])
+            Callback(len(DATA[start : start + 1000]))
+
+
+@pytest.mark.parametrize("verbose", [True, False])
+def test_download_file(tmp_path, monkeypatch, verbose):
+    monkeypatch.setattr(
+        "tidy3d.web.core.s3utils.get_s3_sts_token", lambda resource_id, remote_filename: FakeToken()
+    )
+    chunks = []
+    to_file = download_file(
+        "task_id",
+        "output/monitor_data.hdf5",
+        to_file=str(tmp_path / "sub" / "data.hdf5"),
+        verbose=verbose,
+        progress_callback=chunks.append if not verbose else None,
+    )
+    assert to_file == tmp_path / "sub" / "data.hdf5"
+    assert to_file.read_bytes() == DATA
+    if not verbose:
+        assert sum(chunks) == len(DATA)
@@ -14,7 +14,7 @@ from tidy3d.web.api.webapi import delete, delete_old, download, download_json, r
 from tidy3d.web.api.webapi import download_log, estimate_cost, get_info, get_run_info, get_tasks
 from tidy3d.web.api.webapi import load, load_simulation, start, upload, monitor, real_cost
 from tidy3d.web.api.container import Job, Batch
-from tidy3d.web.api.asynchronous import run_async
+from tidy3d.web.api.asynchronous import run_async, _deduplicate
 
 from tidy3d.__main__ import main
 from tidy3d.web.core.types import TaskType
@@ -540,12 +540,54 @@ def test_batch(mock_webapi, mock_job_status, tmp_path):
 
 
 @responses.activate
-def test_async(mock_webapi, mock_job_status):
+def test_async(mock_webapi, mock_job_status, monkeypatch):
     # monkeypatch.setattr("tidy3d.web.api.container.Job.status", property(lambda self: "success"))
     sims = {TASK_NAME: make_sim()}
+
+    # simulations are only deduplicated on request
+    def mock_deduplicate(*args, **kwargs):
+        raise AssertionError("Simulations should not be deduplicated by default.")
+
+    monkeypatch.setattr("tidy3d.web.api.asynchronous._deduplicate", mock_deduplicate)
     _ = run_async(sims, folder_name=PROJECT_NAME)
 
 
+@responses.activate
+def test_async_duplicates(mock_webapi, mock_job_status):
+    sims = {TASK_NAME: make_sim(), "duplicate": make_sim()}
+    batch_data = run_async(sims, folder_name=PROJECT_NAME, deduplicate=True)
+    assert list(batch_data.task_ids) == list(sims)
+    assert batch_data.task_ids["duplicate"] == batch_data.task_ids[TASK_NAME]
+    assert batch_data.task_paths["duplicate"] == batch_data.task_paths[TASK_NAME]
+
+
+def test_deduplicate_hashes_contents_only_on_collision(monkeypatch):
+    hash_self = Simulation._hash_self
+    hashed = []
+
+    def counting_hash_self(self):
+        hashed.append(self)
+        return hash_self(self)
+
+    monkeypatch.setattr(Simulation, "_hash_self", counting_hash_self)
+
+    sim = make_sim()
+    other = sim.updated_copy(run_time=2 * sim.run_time)
+    unique, duplicates = _deduplicate({"a": sim, "b": other})
+    assert list(unique) == ["a", "b"]
+    assert not duplicates
+    assert not hashed
+
+    unique, duplicates = _deduplicate({"a": sim, "b": other, "c": make_sim()})
+    assert list(unique) == ["a", "b"]
+    assert duplicates == {"c": "a"}
+    assert len(hashed) == 2
+
+    unique, duplicates = _deduplicate({"a": sim, "c": make_sim()}, parent_tasks={"c": ["id"]})
+    assert list(unique) == ["a", "c"]
+    assert not duplicates
+
+
 """ Main """
 
 
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+import gzip
 import pathlib
 import os
+import shutil
 import tempfile
 from functools import wraps
-from typing import List, Callable, Dict, Union, Tuple, Any
+from typing import List, Callable, Dict, Union, Tuple, Any, BinaryIO
 from math import ceil
 import io
 import hashlib
@@ -31,6 +33,8 @@ INDENT = None  # default indentation of json string used internally
 JSON_TAG = "JSON_STRING"
 # If json string is larger than ``MAX_STRING_LENGTH``, split the string when storing in hdf5
 MAX_STRING_LENGTH = 1e9
+# size (bytes) above which temporary serialized data is spilled from memory to disk
+SPOOL_MAX_SIZE = 64 * 1024**2
 FORBID_SPECIAL_CHARACTERS = ["/"]
 
 
@@ -610,7 +614,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         )
         return cls.parse_obj(model_dict, **parse_obj_kwargs)
 
-    def to_hdf5(self, fname: str, custom_encoders: List[Callable] = None) -> None:
+    def to_hdf5(
+        self, fname: str, custom_encoders: List[Callable] = None, compression: Dict = None
+    ) -> None:
         """Exports :class:`Tidy3dBaseModel` instance to .hdf5 file.
 
         Parameters
@@ -620,6 +626,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         custom_encoders : List[Callable]
             List of functions accepting (fname: str, group_path: str, value: Any) that take
             the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``.
+        compression : Dict = None
+            Keyword arguments passed to ``h5py`` when creating the datasets of the data arrays,
+            e.g. ``{"compression": "gzip", "shuffle": True}``. Datasets are then chunked.
 
         Example
         -------
@@ -646,7 +655,7 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
                     # write the path to the element of the json dict where the data_array should be
                     if isinstance(value, xr.DataArray):
-                        value.to_hdf5(fname=f_handle, group_path=subpath)
+                        value.to_hdf5(fname=f_handle, group_path=subpath, compression=compression)
 
                     # if a tuple, assign each element a unique key
                     if isinstance(value, (list, tuple)):
@@ -661,14 +670,18 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
     @classmethod
     def dict_from_hdf5_gz(
-        cls, fname: str, group_path: str = "", custom_decoders: List[Callable] = None
+        cls,
+        fname: Union[str, BinaryIO],
+        group_path: str = "",
+        custom_decoders: List[Callable] = None,
     ) -> dict:
         """Loads a dictionary containing the model contents from a .hdf5.gz file.
 
         Parameters
         ----------
-        fname : str
-            Full path to the .hdf5.gz file to load the :class:`Tidy3dBaseModel` from.
+        fname : Union[str, BinaryIO]
+            Full path to the .hdf5.gz file to load the :class:`Tidy3dBaseModel` from, or a readable
+            binary file object. In the latter case the data is extracted in memory.
         group_path : str, optional
             Path to a group inside the file to selectively load a sub-element of the model only.
         custom_decoders : List[Callable]
@@ -685,6 +698,14 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         -------
         >>> sim_dict = Simulation.dict_from_hdf5(fname='folder/sim.hdf5.gz') # doctest: +SKIP
         """
+        if not isinstance(fname, (str, os.PathLike)):
+            extracted = io.BytesIO()
+            with gzip.GzipFile(fileobj=fname, mode="rb") as file_in:
+                shutil.copyfileobj(file_in, extracted)
+            return cls.dict_from_hdf5(
+                extracted, group_path=group_path, custom_decoders=custom_decoders
+            )
+
         file, extracted = tempfile.mkstemp(".hdf5")
         os.close(file)
         try:
@@ -700,7 +721,7 @@ class Tidy3dBaseModel(pydantic.BaseModel):
     @classmethod
     def from_hdf5_gz(
         cls,
-        fname: str,
+        fname: Union[str, BinaryIO],
         group_path: str = "",
         custom_decoders: List[Callable] = None,
         **parse_obj_kwargs,
@@ -709,8 +730,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
         Parameters
         ----------
-        fname : str
-            Full path to the .hdf5.gz file to load the :class:`Tidy3dBaseModel` from.
+        fname : Union[str, BinaryIO]
+            Full path to the .hdf5.gz file to load the :class:`Tidy3dBaseModel` from, or a readable
+            binary file object.
         group_path : str, optional
             Path to a group inside the file to selectively load a sub-element of the model only.
             Starting `/` is optional.
@@ -732,13 +754,17 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         )
         return cls.parse_obj(model_dict, **parse_obj_kwargs)
 
-    def to_hdf5_gz(self, fname: str, custom_encoders: List[Callable] = None) -> None:
+    def to_hdf5_gz(
+        self, fname: Union[str, BinaryIO], custom_encoders: List[Callable] = None
+    ) -> None:
         """Exports :class:`Tidy3dBaseModel` instance to .hdf5.gz file.
 
         Parameters
         ----------
-        fname : str
-            Full path to the .hdf5.gz file to save the :class:`Tidy3dBaseModel` to.
+        fname : Union[str, BinaryIO]
+            Full path to the .hdf5.gz file to save the :class:`Tidy3dBaseModel` to, or a writable
+            binary file object. In the latter case the data is serialized to a temporary buffer,
+            kept in memory up to ``SPOOL_MAX_SIZE`` bytes, and then compressed into the object.
         custom_encoders : List[Callable]
             List of functions accepting (fname: str, group_path: str, value: Any) that take
             the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``.
@@ -748,6 +774,14 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         >>> simulation.to_hdf5_gz(fname='folder/sim.hdf5.gz') # doctest: +SKIP
         """
 
+        if not isinstance(fname, (str, os.PathLike)):
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as decompressed:
+                self.to_hdf5(decompressed, custom_encoders=custom_encoders)
+                decompressed.seek(0)
+                with gzip.GzipFile(fileobj=fname, mode="wb") as file_out:
+                    shutil.copyfileobj(decompressed, file_out)
+            return
+
         file, decompressed = tempfile.mkstemp(".hdf5")
         os.close(file)
         try:
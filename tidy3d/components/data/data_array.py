@@ -43,6 +43,36 @@ DIM_ATTRS = {
 # name of the DataArray.values in the hdf5 file (xarray's default name too)
 DATA_ARRAY_VALUE_NAME = "__xarray_dataarray_variable__"
 
+# target size of a chunk of a compressed hdf5 dataset
+HDF5_CHUNK_NBYTES = 1024 * 1024
+
+
+def _hdf5_chunk_shape(shape: tuple, itemsize: int) -> tuple:
+    """Chunk shape of about ``HDF5_CHUNK_NBYTES``, shrinking the leading dimensions first."""
+    chunks = list(shape)
+    for dim in range(len(chunks)):
+        nbytes = itemsize * int(np.prod(chunks))
+        if nbytes <= HDF5_CHUNK_NBYTES:
+            break
+        chunks[dim] = max(1, chunks[dim] * HDF5_CHUNK_NBYTES // nbytes)
+    return tuple(chunks)
+
+
+def _hdf5_write_values(
+    group: h5py.Group, name: str, values: np.ndarray, compression: Dict = None
+) -> None:
+    """Write ``values`` to ``group[name]``. If ``compression`` is given, non-empty numeric arrays
+    are stored in a chunked dataset created with these filter keyword arguments."""
+    if compression and values.size > 0 and values.ndim > 0 and values.dtype.kind in "biufc":
+        group.create_dataset(
+            name,
+            data=values,
+            chunks=_hdf5_chunk_shape(values.shape, values.itemsize),
+            **compression,
+        )
+    else:
+        group[name] = values
+
 
 class DataArray(xr.DataArray):
     """Subclass of ``xr.DataArray`` that requires _dims to match the keys of the coords."""
@@ -139,23 +169,32 @@ class DataArray(xr.DataArray):
         """Absolute value of data array."""
         return abs(self)
 
-    def to_hdf5(self, fname: Union[str, h5py.File], group_path: str) -> None:
-        """Save an xr.DataArray to the hdf5 file or file handle with a given path to the group."""
+    def to_hdf5(
+        self, fname: Union[str, h5py.File], group_path: str, compression: Dict = None
+    ) -> None:
+        """Save an xr.DataArray to the hdf5 file or file handle with a given path to the group.
+        If ``compression`` is given, numeric values are stored in chunked datasets created with
+        these filter keyword arguments (e.g. ``compression``, ``compression_opts``, ``shuffle``).
+        """
 
         # file name passed
         if isinstance(fname, str):
             with h5py.File(fname, "w") as f_handle:
-                self.to_hdf5_handle(f_handle=f_handle, group_path=group_path)
+                self.to_hdf5_handle(
+                    f_handle=f_handle, group_path=group_path, compression=compression
+                )
 
         # file handle passed
         else:
-            self.to_hdf5_handle(f_handle=fname, group_path=group_path)
+            self.to_hdf5_handle(f_handle=fname, group_path=group_path, compression=compression)
 
-    def to_hdf5_handle(self, f_handle: h5py.File, group_path: str) -> None:
+    def to_hdf5_handle(
+        self, f_handle: h5py.File, group_path: str, compression: Dict = None
+    ) -> None:
         """Save an xr.DataArray to the hdf5 file handle with a given path to the group."""
 
         sub_group = f_handle.create_group(group_path)
-        sub_group[DATA_ARRAY_VALUE_NAME] = self.values
+        _hdf5_write_values(sub_group, DATA_ARRAY_VALUE_NAME, self.values, compression)
         for key, val in self.coords.items():
             if val.dtype == "<U1":
                 sub_group[key] = val.values.tolist()
@@ -1,7 +1,7 @@
 """Base model for Tidy3D components that are compatible with jax."""
 from __future__ import annotations
 
-from typing import Tuple, List, Any, Callable
+from typing import Tuple, List, Any, Callable, Dict
 import json
 
 import numpy as np
@@ -201,7 +201,9 @@ class JaxObject(Tidy3dBaseModel):
 
     # TODO: replace with implementing these in DataArray
 
-    def to_hdf5(self, fname: str, custom_encoders: List[Callable] = None) -> None:
+    def to_hdf5(
+        self, fname: str, custom_encoders: List[Callable] = None, compression: Dict = None
+    ) -> None:
         """Exports :class:`JaxObject` instance to .hdf5 file.
 
         Parameters
@@ -211,6 +213,9 @@ class JaxObject(Tidy3dBaseModel):
         custom_encoders : List[Callable]
             List of functions accepting (fname: str, group_path: str, value: Any) that take
             the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``.
+        compression : Dict = None
+            Keyword arguments passed to ``h5py`` when creating the datasets of the data arrays,
+            e.g. ``{"compression": "gzip", "shuffle": True}``. Datasets are then chunked.
 
         Example
         -------
@@ -221,14 +226,16 @@ class JaxObject(Tidy3dBaseModel):
             """Custom encoder to convert the JaxDataArray dict to an instance."""
             if isinstance(value, dict) and "type" in value and value["type"] == "JaxDataArray":
                 data_array = JaxDataArray(values=value["values"], coords=value["coords"])
-                data_array.to_hdf5(fname=fname, group_path=group_path)
+                data_array.to_hdf5(fname=fname, group_path=group_path, compression=compression)
 
         if custom_encoders is None:
             custom_encoders = []
 
         custom_encoders += [data_array_encoder]
 
-        return super().to_hdf5(fname=fname, custom_encoders=custom_encoders)
+        return super().to_hdf5(
+            fname=fname, custom_encoders=custom_encoders, compression=compression
+        )
 
     @classmethod
     def dict_from_hdf5(
@@ -12,6 +12,7 @@ from jax.tree_util import register_pytree_node_class
 import xarray as xr
 
 from .....components.base import Tidy3dBaseModel, cached_property, skip_if_fields_missing
+from .....components.data.data_array import _hdf5_write_values
 from .....exceptions import DataError, Tidy3dKeyError, AdjointError
 
 
@@ -90,10 +91,12 @@ class JaxDataArray(Tidy3dBaseModel):
         """Check if two ``JaxDataArray`` instances are equal."""
         return jnp.array_equal(self.values, other.values)
 
-    def to_hdf5(self, fname: str, group_path: str) -> None:
-        """Save an xr.DataArray to the hdf5 file with a given path to the group."""
+    def to_hdf5(self, fname: str, group_path: str, compression: Dict = None) -> None:
+        """Save an xr.DataArray to the hdf5 file with a given path to the group. If
+        ``compression`` is given, numeric values are stored in a chunked dataset created with these
+        filter keyword arguments."""
         sub_group = fname.create_group(group_path)
-        sub_group["values"] = self.values
+        _hdf5_write_values(sub_group, "values", np.asarray(self.values), compression)
         dims = []
         for key, val in self.coords.items():
             # sub_group[key] = val
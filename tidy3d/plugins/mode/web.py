@@ -1,4 +1,4 @@
 """Web API for mode solver"""
-from ...web.api.mode import run
+from ...web.api.mode import run, run_batch
 
-__all__ = ["run"]
+__all__ = ["run", "run_batch"]
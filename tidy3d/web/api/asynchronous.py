@@ -1,5 +1,5 @@
 """Interface to run several jobs in batch using simplified syntax."""
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .container import DEFAULT_DATA_DIR, BatchData, Batch
 from .tidy3d_stub import SimulationType
@@ -15,6 +15,7 @@ def run_async(
     verbose: bool = True,
     simulation_type: str = "tidy3d",
     parent_tasks: Dict[str, List[str]] = None,
+    deduplicate: bool = False,
 ) -> BatchData:
     """Submits a set of Union[:class:`.Simulation`, :class:`.HeatSimulation`] objects to server,
     starts running, monitors progress, downloads, and loads results as a :class:`.BatchData` object.
@@ -36,6 +37,10 @@ def run_async(
         Number of tasks to submit at once in a batch, if None, will run all at the same time.
     verbose : bool = True
         If ``True``, will print progressbars and status, otherwise, will run silently.
+    deduplicate : bool = False
+        If ``True``, identical simulations are uploaded and run only once, and their task names in
+        the returned :class:`BatchData` refer to the same task and data file. Otherwise, every
+        task name is run as its own task.
 
     Returns
     ------
@@ -63,8 +68,18 @@ def run_async(
             "simulations will now be uploaded in a single batch."
         )
 
+    # identical simulations are uploaded and run only once, duplicates share the original task
+    unique_simulations, duplicates = simulations, {}
+    if deduplicate:
+        unique_simulations, duplicates = _deduplicate(simulations, parent_tasks)
+    if duplicates:
+        log.info(
+            f"Running {len(unique_simulations)} distinct simulations out of {len(simulations)}, "
+            "identical simulations share the same task."
+        )
+
     batch = Batch(
-        simulations=simulations,
+        simulations=unique_simulations,
         folder_name=folder_name,
         callback_url=callback_url,
         verbose=verbose,
@@ -73,4 +88,60 @@ def run_async(
     )
 
     batch_data = batch.run(path_dir=path_dir)
-    return batch_data
+    if not duplicates:
+        return batch_data
+
+    original_names = {task_name: duplicates.get(task_name, task_name) for task_name in simulations}
+    return batch_data.updated_copy(
+        task_paths={name: batch_data.task_paths[orig] for name, orig in original_names.items()},
+        task_ids={name: batch_data.task_ids[orig] for name, orig in original_names.items()},
+    )
+
+
+def _deduplicate(
+    simulations: Dict[str, SimulationType], parent_tasks: Dict[str, List[str]] = None
+) -> Tuple[Dict[str, SimulationType], Dict[str, str]]:
+    """Split simulations into the distinct ones and the duplicates.
+
+    Simulations are first grouped by their parent tasks and their (json based) hash. Only
+    simulations sharing a group are then compared by a hash of their hdf5 contents, which also
+    covers their data arrays.
+
+    Parameters
+    ----------
+    simulations : Dict[str, Union[:class:`.Simulation`, :class:`.HeatSimulation`]]
+        Mapping of task name to simulation.
+    parent_tasks : Dict[str, List[str]] = None
+        Mapping of task name to parent task ids, if any.
+
+    Returns
+    -------
+    Tuple[Dict[str, Union[:class:`.Simulation`, :class:`.HeatSimulation`]], Dict[str, str]]
+        The distinct simulations by task name, and a mapping from the task name of each duplicate
+        to the task name of its first occurrence.
+    """
+
+    parent_tasks = parent_tasks or {}
+    groups = {}
+    for task_name, simulation in simulations.items():
+        key = (hash(simulation), tuple(parent_tasks.get(task_name, ())))
+        groups.setdefault(key, []).append(task_name)
+
+    duplicates = {}
+    for task_names in groups.values():
+        if len(task_names) == 1:
+            continue
+        first_task_names = {}
+        for task_name in task_names:
+            first_task_name = first_task_names.setdefault(
+                simulations[task_name]._hash_self(), task_name
+            )
+            if first_task_name != task_name:
+                duplicates[task_name] = first_task_name
+
+    unique_simulations = {
+        task_name: simulation
+        for task_name, simulation in simulations.items()
+        if task_name not in duplicates
+    }
+    return unique_simulations, duplicates
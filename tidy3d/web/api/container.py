@@ -526,8 +526,10 @@ class Batch(WebContainer):
 
         verbose = bool(values.get("verbose"))
         solver_version = values.get("solver_version")
+        simulations = values.get("simulations")
         jobs = {}
-        for task_name, simulation in values.get("simulations").items():
+        upload_start = time.perf_counter()
+        for task_name, simulation in simulations.items():
             upload_kwargs = {key: values.get(key) for key in JobType._upload_fields}
             upload_kwargs["task_name"] = task_name
             upload_kwargs["simulation"] = simulation
@@ -537,6 +539,10 @@ class Batch(WebContainer):
                 upload_kwargs["parent_tasks"] = parent_tasks[task_name]
             job = JobType(**upload_kwargs)
             jobs[task_name] = job
+        log.info(
+            f"Uploaded {len(simulations)} simulations to folder '{values.get('folder_name')}' "
+            f"in {time.perf_counter() - upload_start:.2f} s."
+        )
         return jobs
 
     def get_info(self) -> Dict[TaskName, TaskInfo]:
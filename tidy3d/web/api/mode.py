@@ -1,27 +1,40 @@
 """Web API for mode solver"""
 
 from __future__ import annotations
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Tuple
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import os
+import functools
+import io
+import itertools
+import json
 import pathlib
 import tempfile
 import time
 
 import pydantic.v1 as pydantic
 from botocore.exceptions import ClientError
+from rich.console import Console
 
 from ..core.environment import Env
+from ...components.base import SPOOL_MAX_SIZE
 from ...components.simulation import Simulation
 from ...components.data.monitor_data import ModeSolverData
 from ...components.medium import AbstractCustomMedium
 from ...components.types import Literal
-from ...exceptions import WebError
-from ...log import log, get_logging_console
+from ...exceptions import WebError, Tidy3dImportError
+from ...log import log, get_logging_console, _get_level_int
+from ...packaging import check_import
 from ..core.core_config import get_logger_console
-from ..core.http_util import http
-from ..core.s3utils import download_file, download_gz_file, upload_file
+from ..core.http_util import http, POOL_SIZE
+from ..core.s3utils import (
+    download_file,
+    download_fileobj,
+    download_gz_file,
+    download_gz_fileobj,
+    upload_fileobj,
+)
 from ..core.task_core import Folder
 from ..core.types import ResourceLifecycle, Submittable
 
@@ -39,13 +52,31 @@ MODESOLVER_LOG = "output/result.log"
 MODESOLVER_RESULT = "output/result.hdf5"
 MODESOLVER_RESULT_GZ = "output/mode_solver_data.hdf5.gz"
 
+# key in the simulation's cached properties marking it as validated for upload
+SIM_VALIDATED_KEY = "mode_solver_pre_upload_validated"
+
+# Upload the mode solver as .hdf5 with natively shuffle + zstd compressed datasets instead of
+# gzipping the whole .hdf5 file. Requires the 'hdf5plugin' package; disabled until the server
+# reader supports the zstd filter.
+MODESOLVER_HDF5_ZSTD = False
+MODESOLVER_ZSTD_LEVEL = 3
+
+# status polling interval bounds (seconds); the interval grows while the status is unchanged
+POLL_INTERVAL_MIN = 0.2
+POLL_INTERVAL_MAX = 5.0
+POLL_INTERVAL_FACTOR = 1.5
+# task statuses after which polling stops
+END_STATUSES = ("success", "error", "diverged", "deleted")
+# the next status request is sent this long (seconds) before the polling interval elapses
+POLL_PREFETCH_TIME = 0.2
+
 
 def run(
     mode_solver: ModeSolver,
     task_name: str = "Untitled",
     mode_solver_name: str = "mode_solver",
     folder_name: str = "Mode Solver",
-    results_file: str = "mode_solver.hdf5",
+    results_file: Optional[str] = "mode_solver.hdf5",
     verbose: bool = True,
     progress_callback_upload: Callable[[float], None] = None,
     progress_callback_download: Callable[[float], None] = None,
@@ -64,12 +95,14 @@ def run(
         The name of the mode solver to create the in task.
     folder_name : str = "Mode Solver"
         Name of folder to store task on web UI.
-    results_file : str = "mode_solver.hdf5"
-        Path to download results file (.hdf5).
+    results_file : Optional[str] = "mode_solver.hdf5"
+        Path to download results file (.hdf5). If ``None``, the results are loaded from memory
+        without being written to disk.
     verbose : bool = True
         If ``True``, will print status, otherwise, will run silently.
     progress_callback_upload : Callable[[float], None] = None
-        Optional callback function called when uploading file with ``bytes_in_chunk`` as argument.
+        Optional callback function called when uploading the mode solver file with
+        ``bytes_in_chunk`` as argument.
     progress_callback_download : Callable[[float], None] = None
         Optional callback function called when downloading file with ``bytes_in_chunk`` as argument.
     reduce_simulation : Literal["auto", True, False] = "auto"
@@ -81,12 +114,190 @@ def run(
         Mode solver data with the calculated results.
     """
 
+    tasks, statuses, results = _run_batch(
+        [mode_solver],
+        [task_name],
+        mode_solver_name,
+        folder_name,
+        [results_file],
+        verbose,
+        progress_callback_upload,
+        progress_callback_download,
+        reduce_simulation,
+    )
+
+    if statuses[0] == "error":
+        raise WebError(f"Error running mode solver with task_id='{tasks[0].task_id}'.")
+
+    return results[0]
+
+
+def run_batch(
+    mode_solvers: List[ModeSolver],
+    task_names: List[str] = None,
+    mode_solver_name: str = "mode_solver",
+    folder_name: str = "Mode Solver",
+    results_files: List[Optional[str]] = None,
+    verbose: bool = True,
+    progress_callback_upload: Callable[[float], None] = None,
+    progress_callback_download: Callable[[float], None] = None,
+    reduce_simulation: Literal["auto", True, False] = "auto",
+) -> List[ModeSolverData]:
+    """Submits several :class:`.ModeSolver` objects to server, runs them concurrently, monitors
+    their progress in a single polling loop, downloads, and loads results as a list of
+    :class:`.ModeSolverData` objects.
+
+    Parameters
+    ----------
+    mode_solvers : List[:class:`.ModeSolver`]
+        Mode solvers to upload to server.
+    task_names : List[str] = None
+        Name of the task for each mode solver. If ``None``, tasks are named by their index.
+    mode_solver_name: str = "mode_solver"
+        The name of the mode solver to create the in each task.
+    folder_name : str = "Mode Solver"
+        Name of folder to store the tasks on web UI.
+    results_files : List[Optional[str]] = None
+        Path to download the results file (.hdf5) of each mode solver. If ``None``, all the
+        results are loaded from memory without being written to disk.
+    verbose : bool = True
+        If ``True``, will print status, otherwise, will run silently.
+    progress_callback_upload : Callable[[float], None] = None
+        Optional callback function called when uploading the mode solver file with
+        ``bytes_in_chunk`` as argument.
+    progress_callback_download : Callable[[float], None] = None
+        Optional callback function called when downloading file with ``bytes_in_chunk`` as argument.
+    reduce_simulation : Literal["auto", True, False] = "auto"
+        Restrict simulation to mode solver region. If "auto", then simulation is automatically
+        restricted if it contains custom mediums.
+    Returns
+    -------
+    List[:class:`.ModeSolverData`]
+        Mode solver data with the calculated results for each mode solver, or ``None`` for the
+        mode solvers that did not finish successfully. The tasks that ended in error are logged.
+    """
+
+    if task_names is None:
+        task_names = [f"mode_solver_{index}" for index in range(len(mode_solvers))]
+    if results_files is None:
+        results_files = [None] * len(mode_solvers)
+    if not len(mode_solvers) == len(task_names) == len(results_files):
+        raise ValueError("'task_names' and 'results_files' must have one entry per mode solver.")
+
+    tasks, statuses, results = _run_batch(
+        mode_solvers,
+        task_names,
+        mode_solver_name,
+        folder_name,
+        results_files,
+        verbose,
+        progress_callback_upload,
+        progress_callback_download,
+        reduce_simulation,
+    )
+
+    failed = [
+        f"'{task_name}' (task_id='{task.task_id}')"
+        for task_name, task, status in zip(task_names, tasks, statuses)
+        if status == "error"
+    ]
+    if failed:
+        log.error(f"Error running mode solvers {', '.join(failed)}.")
+
+    return results
+
+
+def _run_batch(
+    mode_solvers: List[ModeSolver],
+    task_names: List[str],
+    mode_solver_name: str,
+    folder_name: str,
+    results_files: List[Optional[str]],
+    verbose: bool,
+    progress_callback_upload: Callable[[float], None],
+    progress_callback_download: Callable[[float], None],
+    reduce_simulation: Literal["auto", True, False],
+) -> Tuple[List[ModeSolverTask], List[str], List[Optional[ModeSolverData]]]:
+    """Run the mode solvers and get the results of the successful ones.
+
+    Returns
+    -------
+    Tuple[List[ModeSolverTask], List[str], List[Optional[:class:`.ModeSolverData`]]]
+        Task, final status and results (``None`` unless successful) of each mode solver.
+    """
+
+    console = get_logging_console() if verbose else None
+    log_status = _status_logger(verbose)
+
+    tasks = [
+        _submit(
+            mode_solver,
+            task_name,
+            mode_solver_name,
+            folder_name,
+            verbose,
+            progress_callback_upload,
+            reduce_simulation,
+            console,
+        )
+        for mode_solver, task_name in zip(mode_solvers, task_names)
+    ]
+
+    if len(tasks) == 1:
+        labels = ["Mode solver"]
+    else:
+        labels = [f"Mode solver '{task_name}'" for task_name in task_names]
+    statuses = _wait(tasks, labels, log_status)
+
+    # Our cache discards None, so the user is able to re-run the unsuccessful mode solvers
+    results = [
+        task.get_result(
+            to_file=results_file, verbose=verbose, progress_callback=progress_callback_download
+        )
+        if status == "success"
+        else None
+        for task, status, results_file in zip(tasks, statuses, results_files)
+    ]
+    return tasks, statuses, results
+
+
+def _status_logger(verbose: bool) -> Callable[[str], None]:
+    """Function emitting status messages. They always go through the log handlers, e.g. to a log
+    file, at DEBUG level if ``verbose`` and INFO otherwise. If ``verbose``, they are also printed
+    to the logging console, unless its log handler already shows them."""
+
     log_level = "DEBUG" if verbose else "INFO"
-    if verbose:
-        console = get_logging_console()
+    console = get_logging_console() if verbose else None
+    console_handler = log.handlers.get("console")
+    if console_handler is not None and console_handler.level <= _get_level_int(log_level):
+        console = None
+
+    def log_status(message: str) -> None:
+        """Log a status message and print it if required."""
+        log.log(log_level, message)
+        if console is not None:
+            console.log(message)
+
+    return log_status
+
+
+def _submit(
+    mode_solver: ModeSolver,
+    task_name: str,
+    mode_solver_name: str,
+    folder_name: str,
+    verbose: bool,
+    progress_callback_upload: Callable[[float], None],
+    reduce_simulation: Literal["auto", True, False],
+    console: Console,
+) -> ModeSolverTask:
+    """Create a task for a mode solver, upload it and start running it."""
 
     if reduce_simulation == "auto":
-        sim_mediums = mode_solver.simulation.scene.mediums
+        # scan the mediums lazily: building 'scene.mediums' validates a new scene and hashes
+        # every medium, while the scan can stop at the first custom medium found
+        sim = mode_solver.simulation
+        sim_mediums = itertools.chain((sim.medium,), (s.medium for s in sim.structures))
         contains_custom = any(isinstance(med, AbstractCustomMedium) for med in sim_mediums)
         reduce_simulation = contains_custom
 
@@ -103,43 +314,84 @@ def run(
         mode_solver = mode_solver.reduced_simulation_copy
 
     task = ModeSolverTask.create(mode_solver, task_name, mode_solver_name, folder_name)
-    if verbose:
+    if console is not None:
         console.log(
             f"Mode solver created with task_id='{task.task_id}', solver_id='{task.solver_id}'."
         )
     task.upload(verbose=verbose, progress_callback=progress_callback_upload)
     task.submit()
+    return task
 
-    # Wait for task to finish
-    prev_status = "draft"
-    status = task.status
-    while status not in ("success", "error", "diverged", "deleted"):
-        if status != prev_status:
-            log.log(log_level, f"Mode solver status: {status}")
-            if verbose:
-                console.log(f"Mode solver status: {status}")
-            prev_status = status
-        time.sleep(0.5)
-        status = task.get_info().status
-
-    if status == "error":
-        raise WebError("Error running mode solver.")
 
-    log.log(log_level, f"Mode solver status: {status}")
-    if verbose:
-        console.log(f"Mode solver status: {status}")
-
-    if status != "success":
-        # Our cache discards None, so the user is able to re-run
-        return None
-
-    return task.get_result(
-        to_file=results_file, verbose=verbose, progress_callback=progress_callback_download
-    )
+def _wait(
+    tasks: List[ModeSolverTask], labels: List[str], log_status: Callable[[str], None]
+) -> List[str]:
+    """Wait for all tasks to finish, passing the status changes of each task with its label to
+    ``log_status``.
 
+    Returns
+    -------
+    List[str]
+        Final status of each task.
+    """
 
-class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow):
-    """Interface for managing the running of a :class:`.ModeSolver` task on server."""
+    statuses = [task.status for task in tasks]
+    logged_statuses = ["draft"] * len(tasks)
+
+    def log_status_changes() -> bool:
+        """Log the statuses that changed since the last call, return whether any did."""
+        changed = False
+        for index, (label, status) in enumerate(zip(labels, statuses)):
+            if status != logged_statuses[index]:
+                log_status(f"{label} status: {status}")
+                logged_statuses[index] = status
+                changed = True
+        return changed
+
+    # Poll the pending tasks together, backing off exponentially while no status changes. The
+    # status requests are sent concurrently over the pooled HTTP session.
+    delay = POLL_INTERVAL_MIN
+    with ThreadPoolExecutor(max_workers=max(min(len(tasks), POOL_SIZE), 1)) as executor:
+        while True:
+            if log_status_changes():
+                delay = POLL_INTERVAL_MIN
+            pending = [index for index, status in enumerate(statuses) if status not in END_STATUSES]
+            if not pending:
+                break
+            # issue the status requests before the wait is over to hide their latency
+            time.sleep(max(delay - POLL_PREFETCH_TIME, 0))
+            futures = {index: executor.submit(tasks[index].get_info) for index in pending}
+            time.sleep(min(delay, POLL_PREFETCH_TIME))
+            delay = min(delay * POLL_INTERVAL_FACTOR, POLL_INTERVAL_MAX)
+            for index, future in futures.items():
+                statuses[index] = future.result().status
+
+    return statuses
+
+
+def _import_hdf5plugin():
+    """Import 'hdf5plugin', which also registers its compression filters with ``h5py``."""
+    try:
+        import hdf5plugin
+    except ImportError as e:
+        raise Tidy3dImportError(
+            "The package 'hdf5plugin' is required to transfer mode solvers with zstd compression, "
+            "but it was not found. Please install it using 'pip install hdf5plugin'."
+        ) from e
+    return hdf5plugin
+
+
+def _hdf5_zstd_compression() -> dict:
+    """Keyword arguments for ``h5py`` datasets with shuffle + zstd compression."""
+    hdf5plugin = _import_hdf5plugin()
+    return dict(shuffle=True, **hdf5plugin.Zstd(clevel=MODESOLVER_ZSTD_LEVEL))
+
+
+class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.ignore):
+    """Interface for managing the running of a :class:`.ModeSolver` task on server.
+
+    Only the fields below are kept from the server responses, other keys are discarded.
+    """
 
     task_id: str = pydantic.Field(
         None,
@@ -211,14 +463,20 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
         folder = Folder.get(folder_name, create=True)
 
         mode_solver.validate_pre_upload()
-        mode_solver.simulation.validate_pre_upload(source_required=False)
+
+        # the simulation is immutable and often shared by several mode solvers (e.g. in sweeps),
+        # so each simulation instance only needs to be validated once
+        sim = mode_solver.simulation
+        if not sim._cached_properties.get(SIM_VALIDATED_KEY):
+            sim.validate_pre_upload(source_required=False)
+            sim._cached_properties[SIM_VALIDATED_KEY] = True
 
         response_body = {
             "projectId": folder.folder_id,
             "taskName": task_name,
             "protocolVersion": __version__,
             "modeSolverName": mode_solver_name,
-            "fileType": "Gz",
+            "fileType": "Hdf5" if MODESOLVER_HDF5_ZSTD else "Gz",
             "source": "Python",
         }
 
@@ -244,7 +502,7 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
         cls,
         task_id: str,
         solver_id: str,
-        to_file: str = "mode_solver.hdf5",
+        to_file: Optional[str] = "mode_solver.hdf5",
         sim_file: str = "simulation.hdf5",
         verbose: bool = True,
         progress_callback: Callable[[float], None] = None,
@@ -257,8 +515,9 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
             Unique identifier of the task on server.
         solver_id: str
             Unique identifier of the mode solver in the task.
-        to_file: str = "mode_solver.hdf5"
-            File to store the mode solver downloaded from the task.
+        to_file: Optional[str] = "mode_solver.hdf5"
+            File to store the mode solver downloaded from the task. If ``None``, the mode solver
+            is not written to disk.
         sim_file: str = "simulation.hdf5"
             File to store the simulation downloaded from the task.
         verbose: bool = True
@@ -298,41 +557,61 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
         verbose: bool = True
             Whether to display progress bars.
         progress_callback : Callable[[float], None] = None
-            Optional callback function called while uploading the data.
+            Optional callback function called while uploading the mode solver data, which is
+            uploaded alongside the simulation file.
         """
-        mode_solver = self.mode_solver.copy()
-
+        # Tidy3D components are immutable, so the mode solver can be serialized without a copy
+        mode_solver = self.mode_solver
         sim = mode_solver.simulation
 
-        # Upload simulation.hdf5.gz for GUI display
-        file, file_name = tempfile.mkstemp(".hdf5.gz")
-        os.close(file)
-        try:
-            sim.to_hdf5_gz(file_name)
-            upload_file(
-                self.task_id,
-                file_name,
-                SIM_FILE_HDF5_GZ,
-                verbose=verbose,
-                progress_callback=progress_callback,
-            )
-        finally:
-            os.unlink(file_name)
+        def _upload(
+            resource_id: str,
+            write: Callable,
+            remote_filename: str,
+            show_progress: bool,
+            callback: Callable[[float], None],
+        ):
+            """Serialize to a temporary file with ``write`` and upload it once written. The file
+            is kept in memory unless it is larger than ``SPOOL_MAX_SIZE``."""
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as data:
+                write(data)
+                data.seek(0)
+                upload_fileobj(
+                    resource_id,
+                    data,
+                    remote_filename,
+                    verbose=show_progress,
+                    progress_callback=callback,
+                )
 
-        # Upload a single HDF5 file with the full data
-        file, file_name = tempfile.mkstemp(".hdf5.gz")
-        os.close(file)
-        try:
-            mode_solver.to_hdf5_gz(file_name)
-            upload_file(
-                self.solver_id,
-                file_name,
-                MODESOLVER_GZ,
-                verbose=verbose,
-                progress_callback=progress_callback,
-            )
-        finally:
-            os.unlink(file_name)
+        if self.file_type == "Hdf5":
+            compression = _hdf5_zstd_compression()
+            write_mode_solver = functools.partial(mode_solver.to_hdf5, compression=compression)
+            mode_solver_file = MODESOLVER_HDF5
+        else:
+            write_mode_solver = mode_solver.to_hdf5_gz
+            mode_solver_file = MODESOLVER_GZ
+
+        # The uploads are independent, so run them concurrently: simulation.hdf5.gz is only used
+        # for GUI display, and a single HDF5 file holds the full data. Only the latter reports its
+        # progress, as rich supports a single live display at a time and the user callback should
+        # not receive the interleaved byte counts of both files from different threads.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    _upload, self.task_id, sim.to_hdf5_gz, SIM_FILE_HDF5_GZ, False, None
+                ),
+                executor.submit(
+                    _upload,
+                    self.solver_id,
+                    write_mode_solver,
+                    mode_solver_file,
+                    verbose,
+                    progress_callback,
+                ),
+            ]
+            for future in futures:
+                future.result()
 
     def submit(self):
         """Start the execution of this task.
@@ -360,7 +639,7 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
 
     def get_modesolver(
         self,
-        to_file: str = "mode_solver.hdf5",
+        to_file: Optional[str] = "mode_solver.hdf5",
         sim_file: str = "simulation.hdf5",
         verbose: bool = True,
         progress_callback: Callable[[float], None] = None,
@@ -369,8 +648,9 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
 
         Parameters
         ----------
-        to_file: str = "mode_solver.hdf5"
-            File to store the mode solver downloaded from the task.
+        to_file: Optional[str] = "mode_solver.hdf5"
+            File to store the mode solver downloaded from the task. If ``None``, the mode solver
+            is not written to disk.
         sim_file: str = "simulation.hdf5"
             File to store the simulation downloaded from the task, if any.
         verbose: bool = True
@@ -384,49 +664,45 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
             :class:`ModeSolver` object associated with this task.
         """
         if self.file_type == "Gz":
-            file, file_path = tempfile.mkstemp(".hdf5.gz")
-            os.close(file)
-            try:
-                download_file(
-                    self.solver_id,
-                    MODESOLVER_GZ,
-                    to_file=file_path,
-                    verbose=verbose,
-                    progress_callback=progress_callback,
-                )
-                mode_solver = ModeSolver.from_hdf5_gz(file_path)
-            finally:
-                os.unlink(file_path)
+            file = download_gz_fileobj(
+                self.solver_id,
+                MODESOLVER_GZ,
+                io.BytesIO(),
+                verbose=verbose,
+                progress_callback=progress_callback,
+            )
+            mode_solver = ModeSolver.from_hdf5(file)
 
         elif self.file_type == "Hdf5":
-            file, file_path = tempfile.mkstemp(".hdf5")
-            os.close(file)
+            # registers the zstd filter for natively compressed files, which is only required if
+            # mode solvers are transferred with it
+            if MODESOLVER_HDF5_ZSTD:
+                _import_hdf5plugin()
+            else:
+                check_import("hdf5plugin")
+            file = download_fileobj(
+                self.solver_id,
+                MODESOLVER_HDF5,
+                io.BytesIO(),
+                verbose=verbose,
+                progress_callback=progress_callback,
+            )
             try:
-                download_file(
-                    self.solver_id,
-                    MODESOLVER_HDF5,
-                    to_file=file_path,
-                    verbose=verbose,
-                    progress_callback=progress_callback,
-                )
-                mode_solver = ModeSolver.from_hdf5(file_path)
-            finally:
-                os.unlink(file_path)
+                mode_solver = ModeSolver.from_hdf5(file)
+            except OSError:
+                # a missing compression filter is reported as missing 'hdf5plugin'
+                _import_hdf5plugin()
+                raise
 
         else:
-            file, file_path = tempfile.mkstemp(".json")
-            os.close(file)
-            try:
-                download_file(
-                    self.solver_id,
-                    MODESOLVER_JSON,
-                    to_file=file_path,
-                    verbose=verbose,
-                    progress_callback=progress_callback,
-                )
-                mode_solver_dict = ModeSolver.dict_from_json(file_path)
-            finally:
-                os.unlink(file_path)
+            file = download_fileobj(
+                self.solver_id,
+                MODESOLVER_JSON,
+                io.BytesIO(),
+                verbose=verbose,
+                progress_callback=progress_callback,
+            )
+            mode_solver_dict = json.load(file)
 
             download_file(
                 self.task_id,
@@ -438,14 +714,20 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
             mode_solver_dict["simulation"] = Simulation.from_json(sim_file)
             mode_solver = ModeSolver.parse_obj(mode_solver_dict)
 
-        # Store requested mode solver file
-        mode_solver.to_file(to_file)
+        # Store requested mode solver file, reusing the downloaded data instead of re-serializing
+        # the mode solver when it is already a plain hdf5 file
+        if to_file is not None:
+            if self.file_type == "Gz" and str(to_file).lower().endswith((".hdf5", ".h5")):
+                with open(to_file, "wb") as file_out:
+                    file_out.write(file.getbuffer())
+            else:
+                mode_solver.to_file(to_file)
 
         return mode_solver
 
     def get_result(
         self,
-        to_file: str = "mode_solver_data.hdf5",
+        to_file: Optional[str] = "mode_solver_data.hdf5",
         verbose: bool = True,
         progress_callback: Callable[[float], None] = None,
     ) -> ModeSolverData:
@@ -453,8 +735,9 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
 
         Parameters
         ----------
-        to_file: str = "mode_solver_data.hdf5"
-            File to store the mode solver downloaded from the task.
+        to_file: Optional[str] = "mode_solver_data.hdf5"
+            File to store the mode solver downloaded from the task. If ``None``, the results are
+            loaded from memory without being written to disk.
         verbose: bool = True
             Whether to display progress bars.
         progress_callback : Callable[[float], None] = None
@@ -466,12 +749,20 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
             Mode solver data with the calculated results.
         """
 
+        if to_file is None:
+            result_file = io.BytesIO()
+            download_gz = functools.partial(download_gz_fileobj, fileobj=result_file)
+            download = functools.partial(download_fileobj, fileobj=result_file)
+        else:
+            result_file = to_file
+            download_gz = functools.partial(download_gz_file, to_file=to_file)
+            download = functools.partial(download_file, to_file=to_file)
+
         file = None
         try:
-            file = download_gz_file(
+            file = download_gz(
                 resource_id=self.solver_id,
                 remote_filename=MODESOLVER_RESULT_GZ,
-                to_file=to_file,
                 verbose=verbose,
                 progress_callback=progress_callback,
             )
@@ -482,10 +773,9 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
 
         if not file:
             try:
-                file = download_file(
+                file = download(
                     resource_id=self.solver_id,
                     remote_filename=MODESOLVER_RESULT,
-                    to_file=to_file,
                     verbose=verbose,
                     progress_callback=progress_callback,
                 )
@@ -495,7 +785,7 @@ class ModeSolverTask(ResourceLifecycle, Submittable, extra=pydantic.Extra.allow)
                     "Please confirm that the task was successfully run."
                 ) from e
 
-        data = ModeSolverData.from_hdf5(to_file)
+        data = ModeSolverData.from_hdf5(result_file)
         data = data.copy(
             update={"monitor": self.mode_solver.to_mode_solver_monitor(name=MODE_MONITOR_NAME)}
         )
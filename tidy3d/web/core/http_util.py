@@ -7,6 +7,7 @@ from typing import Dict
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib3.util.ssl_ import create_urllib3_context
 import toml
 
@@ -29,6 +30,9 @@ from . import core_config
 
 REINITIALIZED = False
 
+# connection pool size of the persistent session
+POOL_SIZE = 4
+
 TIDY3D_DIR = f"{expanduser('~')}"
 if os.access(TIDY3D_DIR, os.W_OK):
     TIDY3D_DIR = f"{expanduser('~')}/.tidy3d"
@@ -145,6 +149,20 @@ def http_interceptor(func):
     return wrapper
 
 
+def get_retry() -> Retry:
+    """Get the retry policy for transient gateway errors.
+
+    Only idempotent methods are retried. Once the retries are exhausted, the last response is
+    returned to the caller instead of raising.
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+
+
 class TLSAdapter(HTTPAdapter):
     def init_poolmanager(self, *args, **kwargs):
         context = create_urllib3_context(ssl_version=Env.current.ssl_version)
@@ -153,21 +171,33 @@ class TLSAdapter(HTTPAdapter):
 
 
 class HttpSessionManager:
-    """Http util class."""
+    """Http util class.
+
+    All requests go through a single persistent session, so connections (and TLS handshakes)
+    are reused across calls, e.g. when polling the status of a task.
+    """
 
     def __init__(self, session: requests.Session):
         """Initialize the session."""
         ssl_version = Env.current.ssl_version
-        if ssl_version:
-            session.mount("https://", TLSAdapter())
+        adapter_type = TLSAdapter if ssl_version else HTTPAdapter
+        session.mount("https://", self._make_adapter(adapter_type))
+        session.mount("http://", self._make_adapter(HTTPAdapter))
         self.session = session
 
+    @staticmethod
+    def _make_adapter(adapter_type: type) -> HTTPAdapter:
+        """Create a pooled adapter with the retry policy."""
+        return adapter_type(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=get_retry()
+        )
+
     def reinit(self):
         """Reinitialize the session."""
         global REINITIALIZED
         ssl_version = Env.current.ssl_version
         if ssl_version and not REINITIALIZED:
-            self.session.mount("https://", TLSAdapter())
+            self.session.mount("https://", self._make_adapter(TLSAdapter))
             REINITIALIZED = True
 
     @http_interceptor
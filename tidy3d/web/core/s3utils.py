@@ -2,12 +2,14 @@
 """
 import os
 import tempfile
+import threading
+import zlib
 
 import pathlib
 import urllib
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Mapping
+from typing import BinaryIO, Callable, Mapping
 
 import boto3
 from boto3.s3.transfer import TransferConfig
@@ -21,6 +23,11 @@ from .core_config import get_logger_console
 from .exceptions import WebError
 
 
+# boto3 session shared by all S3 clients, created on first use
+_s3_session = None
+_s3_session_lock = threading.Lock()
+
+
 class _UserCredential(BaseModel):
     """Stores information about user credentials."""
 
@@ -51,14 +58,20 @@ class _S3STSToken(BaseModel):
     def get_client(self) -> boto3.client:
         """Get the boto client for this token."""
 
-        return boto3.client(
-            "s3",
-            region_name=Env.current.s3_region,
-            aws_access_key_id=self.user_credential.access_key_id,
-            aws_secret_access_key=self.user_credential.secret_access_key,
-            aws_session_token=self.user_credential.session_token,
-            verify=Env.current.ssl_verify,
-        )
+        # sessions are not thread safe, so clients are created one at a time from a shared session
+        # (which loads the S3 service model only once); the clients themselves are thread safe
+        global _s3_session
+        with _s3_session_lock:
+            if _s3_session is None:
+                _s3_session = boto3.session.Session()
+            return _s3_session.client(
+                "s3",
+                region_name=Env.current.s3_region,
+                aws_access_key_id=self.user_credential.access_key_id,
+                aws_secret_access_key=self.user_credential.secret_access_key,
+                aws_session_token=self.user_credential.session_token,
+                verify=Env.current.ssl_verify,
+            )
 
     def is_expired(self) -> bool:
         """True if token is expired."""
@@ -176,6 +189,9 @@ _s3_config = TransferConfig(
 
 _s3_sts_tokens: [str, _S3STSToken] = {}
 
+# zlib window bits to read the gzip format
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 def get_s3_sts_token(
     resource_id: str, file_name: str, extra_arguments: Mapping[str, str] = None
@@ -233,6 +249,44 @@ def upload_file(
         Additional arguments used to specify the upload bucket.
     """
 
+    with open(path, "rb") as data:
+        upload_fileobj(
+            resource_id,
+            data,
+            remote_filename,
+            verbose=verbose,
+            progress_callback=progress_callback,
+            extra_arguments=extra_arguments,
+        )
+
+
+def upload_fileobj(
+    resource_id: str,
+    data: BinaryIO,
+    remote_filename: str,
+    verbose: bool = True,
+    progress_callback: Callable[[float], None] = None,
+    extra_arguments: Mapping[str, str] = None,
+):
+    """Upload the contents of a binary file object to S3. The object must be fully written before
+    the upload starts.
+
+    Parameters
+    ----------
+    resource_id : str
+        The resource id, e.g. task id.
+    data : BinaryIO
+        Seekable binary file object to upload, read from its current position.
+    remote_filename : str
+        The remote file name on S3 relative to the resource context root path.
+    verbose : bool = True
+        Whether to display a progressbar for the upload.
+    progress_callback : Callable[[float], None] = None
+        User-supplied callback function with ``bytes_in_chunk`` as argument.
+    extra_arguments : Mapping[str, str]
+        Additional arguments used to specify the upload bucket.
+    """
+
     token = get_s3_sts_token(resource_id, remote_filename, extra_arguments)
 
     def _upload(_callback: Callable) -> None:
@@ -244,24 +298,23 @@ def upload_file(
             Callback function for upload, accepts ``bytes_in_chunk``
         """
 
-        with open(path, "rb") as data:
-            token.get_client().upload_fileobj(
-                data,
-                Bucket=token.get_bucket(),
-                Key=token.get_s3_key(),
-                Callback=_callback,
-                Config=_s3_config,
-                ExtraArgs={"ContentEncoding": "gzip"}
-                if token.get_s3_key().endswith(".gz")
-                else None,
-            )
+        token.get_client().upload_fileobj(
+            data,
+            Bucket=token.get_bucket(),
+            Key=token.get_s3_key(),
+            Callback=_callback,
+            Config=_s3_config,
+            ExtraArgs={"ContentEncoding": "gzip"} if token.get_s3_key().endswith(".gz") else None,
+        )
 
     if progress_callback is not None:
         _upload(progress_callback)
     else:
         if verbose:
             with _get_progress(_S3Action.UPLOADING) as progress:
-                total_size = pathlib.Path(path).stat().st_size
+                start = data.tell()
+                total_size = data.seek(0, os.SEEK_END) - start
+                data.seek(start)
                 task_id = progress.add_task("upload", filename=remote_filename, total=total_size)
 
                 def _callback(bytes_in_chunk):
@@ -298,10 +351,6 @@ def download_file(
         User-supplied callback function with ``bytes_in_chunk`` as argument.
     """
 
-    token = get_s3_sts_token(resource_id, remote_filename)
-    client = token.get_client()
-    meta_data = client.head_object(Bucket=token.get_bucket(), Key=token.get_s3_key())
-
     # Get only last part of the remote file name
     remote_basename = pathlib.Path(remote_filename).name
 
@@ -315,6 +364,59 @@ def download_file(
     # make the leading directories in the 'to_file', if any
     to_file.parent.mkdir(parents=True, exist_ok=True)
 
+    with open(to_file, "wb") as fileobj:
+        _download_fileobj(resource_id, remote_filename, fileobj, verbose, progress_callback)
+
+    return to_file
+
+
+def download_fileobj(
+    resource_id: str,
+    remote_filename: str,
+    fileobj: BinaryIO,
+    verbose: bool = True,
+    progress_callback: Callable[[float], None] = None,
+) -> BinaryIO:
+    """Download file from S3 into a binary file object, e.g. an in-memory ``io.BytesIO``.
+
+    Parameters
+    ----------
+    resource_id : str
+        The resource id, e.g. task id.
+    remote_filename : str
+        Path to the remote file.
+    fileobj : BinaryIO
+        Writable and seekable binary file object to save to.
+    verbose : bool = True
+        Whether to display a progressbar for the download
+    progress_callback : Callable[[float], None] = None
+        User-supplied callback function with ``bytes_in_chunk`` as argument.
+
+    Returns
+    -------
+    BinaryIO
+        The file object, positioned at the start of the downloaded data.
+    """
+
+    start = fileobj.tell()
+    _download_fileobj(resource_id, remote_filename, fileobj, verbose, progress_callback)
+    fileobj.seek(start)
+    return fileobj
+
+
+def _download_fileobj(
+    resource_id: str,
+    remote_filename: str,
+    fileobj: BinaryIO,
+    verbose: bool,
+    progress_callback: Callable[[float], None],
+) -> None:
+    """Download file from S3 into a binary file object. File objects without ``seek`` are written
+    sequentially, in order."""
+
+    token = get_s3_sts_token(resource_id, remote_filename)
+    client = token.get_client()
+
     def _download(_callback: Callable) -> None:
         """Perform the download with a callback function.
 
@@ -324,10 +426,10 @@ def download_file(
             Callback function for download, accepts ``bytes_in_chunk``
         """
 
-        client.download_file(
+        client.download_fileobj(
             Bucket=token.get_bucket(),
-            Filename=str(to_file),
             Key=token.get_s3_key(),
+            Fileobj=fileobj,
             Callback=_callback,
         )
 
@@ -335,6 +437,8 @@ def download_file(
         _download(progress_callback)
     else:
         if verbose:
+            meta_data = client.head_object(Bucket=token.get_bucket(), Key=token.get_s3_key())
+            remote_basename = pathlib.Path(remote_filename).name
             with _get_progress(_S3Action.DOWNLOADING) as progress:
                 total_size = meta_data.get("ContentLength", 0)
                 progress.start()
@@ -350,8 +454,6 @@ def download_file(
         else:
             _download(lambda bytes_in_chunk: None)
 
-    return to_file
-
 
 def download_gz_file(
     resource_id: str,
@@ -410,3 +512,73 @@ def download_gz_file(
     finally:
         os.unlink(tmp_file_path)
     return to_file
+
+
+class _GunzipWriter:
+    """Write-only file object extracting the gzip data written to it into another file object.
+
+    It has no ``seek`` method, so that boto3 writes the downloaded parts to it in order.
+    """
+
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self._decompressor = zlib.decompressobj(GZIP_WBITS)
+        # whether the current gzip member has received data but is not complete yet
+        self._member_pending = False
+
+    def write(self, data: bytes) -> int:
+        """Extract a chunk of compressed data, which may span several gzip members."""
+        size = len(data)
+        while data:
+            self.fileobj.write(self._decompressor.decompress(data))
+            if not self._decompressor.eof:
+                self._member_pending = True
+                break
+            data = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(GZIP_WBITS)
+            self._member_pending = False
+        return size
+
+    def close(self) -> None:
+        """Write the remaining extracted data, raising if the gzip data ended unexpectedly."""
+        if self._member_pending:
+            raise WebError("Downloaded gzip data is truncated.")
+        self.fileobj.write(self._decompressor.flush())
+
+
+def download_gz_fileobj(
+    resource_id: str,
+    remote_filename: str,
+    fileobj: BinaryIO,
+    verbose: bool = True,
+    progress_callback: Callable[[float], None] = None,
+) -> BinaryIO:
+    """Download a ``.gz`` file and unzip it into a binary file object, without going through the
+    disk.
+
+    Parameters
+    ----------
+    resource_id : str
+        The resource id, e.g. task id.
+    remote_filename : str
+        Path to the remote file.
+    fileobj : BinaryIO
+        Writable and seekable binary file object to save the extracted data to.
+    verbose : bool = True
+        Whether to display a progressbar for the download
+    progress_callback : Callable[[float], None] = None
+        User-supplied callback function with ``bytes_in_chunk`` as argument.
+
+    Returns
+    -------
+    BinaryIO
+        The file object, positioned at the start of the extracted data.
+    """
+
+    # the data is decompressed on the fly while downloading
+    start = fileobj.tell()
+    writer = _GunzipWriter(fileobj)
+    _download_fileobj(resource_id, remote_filename, writer, verbose, progress_callback)
+    writer.close()
+    fileobj.seek(start)
+    return fileobj